@@ -1,6 +1,9 @@
 import streamlit as st
-from requests import get, post, delete
+import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, wait
+import io
 import time
 
 
@@ -9,6 +12,31 @@ if not BACKEND_BASE_URL:
     st.error("BACKEND_BASE_URL이 설정되지 않았습니다. Streamlit Secrets에 등록하세요.")
     st.stop()
 
+
+@st.cache_resource
+def api():
+    # 백엔드/포스터 요청이 TCP 연결을 재사용하도록 세션 공유 (keep-alive)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_poster(url):
+    # rerun마다 포스터를 다시 다운로드하지 않도록 캐시
+    response = api().get(url, timeout=5)
+    response.raise_for_status()
+    return Image.open(io.BytesIO(response.content)).copy()
+
+
+def prefetch_posters(urls):
+    # 포스터들을 병렬로 미리 받아 캐시를 채움 (실패한 포스터는 렌더링 시 에러 표시)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        wait([executor.submit(fetch_poster, url) for url in set(urls)])
+
+
 st.title("영화 평론 리뷰 모음 앱")
 # 사이드바: 영화 추가 및 삭제
 with st.sidebar:
@@ -21,7 +49,7 @@ with st.sidebar:
     poster_url = st.text_input("포스터 URL")
 
     if st.button("영화 추가"):
-        movie_add_response = post(
+        movie_add_response = api().post(
             f"{BACKEND_BASE_URL}/movies/add",
             json={
                 "name": name,
@@ -45,7 +73,9 @@ with st.sidebar:
     st.header("영화 삭제하기")
     del_name = st.text_input("삭제할 영화 이름")
     if st.button("영화 삭제"):
-        movie_del_response = delete(f"{BACKEND_BASE_URL}/movies/delete/{del_name}")
+        movie_del_response = api().delete(
+            f"{BACKEND_BASE_URL}/movies/delete/{del_name}"
+        )
         if movie_del_response.status_code == 200:
             st.success("영화가 성공적으로 삭제되었습니다!")
             time.sleep(1)
@@ -57,7 +87,7 @@ with st.sidebar:
             )
 
 # 영화 목록 불러오기
-movie_get_response = get(f"{BACKEND_BASE_URL}/movies/get")
+movie_get_response = api().get(f"{BACKEND_BASE_URL}/movies/get")
 if movie_get_response.status_code != 200:
     st.error(
         "다음과 같은 이유로 영화 목록 불러오기에 실패했습니다: "
@@ -70,6 +100,7 @@ if len(movies) == 0:
     # 영화가 하나도 없을 때
     st.warning("등록된 영화가 없습니다. 사이드바에서 영화를 추가해 주세요.")
 else:
+    prefetch_posters([movie["poster_url"] for movie in movies])
     with st.expander(label="영화 목록", icon="🎬", expanded=True):
         for movie in movies:
             # 영화 별 리뷰 섹션
@@ -77,7 +108,7 @@ else:
             with col1:
                 st.subheader(movie["name"])
                 try:
-                    img = Image.open(get(movie["poster_url"], stream=True).raw)
+                    img = fetch_poster(movie["poster_url"])
                     st.image(img, width=200)
                 except Exception as e:
                     st.error(f"포스터 이미지를 불러올 수 없습니다: {e}")
@@ -93,25 +124,23 @@ else:
                     else:
                         # 평균 평점 및 신뢰도 점수 표시
                         st.markdown(f"**{movie['name']} 평균 평점**")
-                        comment_score_response = post(
-                            f"{BACKEND_BASE_URL}/movies/comments/{movie['name']}/average_score"
+                        # /movies/get에 이미 모든 댓글이 있으므로 평균은 직접 계산
+                        # (영화마다 average_score API를 호출하지 않음)
+                        comments = movie["comments"]
+                        average_rate_score = sum(
+                            c["rate_score"] for c in comments
+                        ) / len(comments)
+                        average_confidence_score = sum(
+                            c["confidence_score"] for c in comments
+                        ) / len(comments)
+                        st.progress(
+                            average_rate_score / 5,
+                            text=f"영화 평점: {average_rate_score:.2f}/5",
+                        )
+                        st.progress(
+                            average_confidence_score / 1,
+                            text=f"감성 분석 신뢰도 평균: {average_confidence_score:.2f}",
                         )
-                        if comment_score_response.status_code != 200:
-                            st.error(
-                                "다음과 같은 이유로 평균 평점 불러오기에 실패했습니다: "
-                                + comment_score_response.text
-                            )
-                            continue
-                        else:
-                            average_score = comment_score_response.json()
-                            st.progress(
-                                average_score["average_rate_score"] / 5,
-                                text=f"영화 평점: {average_score['average_rate_score']:.2f}/5",
-                            )
-                            st.progress(
-                                average_score["average_confidence_score"] / 1,
-                                text=f"감성 분석 신뢰도 평균: {average_score['average_confidence_score']:.2f}",
-                            )
                         # 리뷰 목록 표시
                         st.markdown(
                             f"**{movie['name']} 리뷰** {len(movie['comments'])}명 참여"
@@ -135,7 +164,7 @@ else:
                                         "리뷰 삭제",
                                         key=f"delete_comment_{movie['name']}_{i}",
                                     ):
-                                        delete_response = delete(
+                                        delete_response = api().delete(
                                             f"{BACKEND_BASE_URL}/movies/comments/delete/{movie['name']}/{comment['user_name']}"
                                         )
                                         if delete_response.status_code == 200:
@@ -167,7 +196,7 @@ else:
                 )
                 if st.form_submit_button(label="리뷰 등록"):
                     with st.spinner("리뷰를 등록하는 중입니다..."):
-                        response = post(
+                        response = api().post(
                             f"{BACKEND_BASE_URL}/movies/comments/add",
                             json={
                                 "movie_name": movie["name"],